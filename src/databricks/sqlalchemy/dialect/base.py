@@ -1,25 +1,58 @@
 import re
-from alembic.ddl.base import ColumnComment, ColumnType
-from sqlalchemy import util, exc
-from sqlalchemy.sql import compiler, sqltypes, ColumnElement
-from sqlalchemy.sql.schema import Column as DefaultColumn
+import string
+from typing import Any, List
+
+from alembic.ddl.base import ColumnComment
+from sqlalchemy import exc
+from sqlalchemy.sql import compiler, sqltypes
+from sqlalchemy.sql.ddl import CreateTable
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.sql.type_api import TypeEngine
+
+
+_LEGAL_CHARACTERS = re.compile(r"^[A-Z0-9_]+$", re.I)
+# ASCII-only equivalent of _LEGAL_CHARACTERS used on the quoting hot path
+_LEGAL_SET = frozenset(string.ascii_letters + string.digits + "_")
+
+# Type used to render comment literals; stateless, so one instance is shared
+_STRING_TYPE = sqltypes.String()
+
+# Separators before the first and each subsequent CREATE TABLE column
+_SEPS = ("\n", ", \n")
+
+# Trailer appended to every CREATE TABLE statement
+_USING_DELTA = " USING DELTA"
+
+# Tail of the ALTER statement that clears a column comment
+_DROP_COMMENT_SUFFIX = " COMMENT '';"
 
 
 class DatabricksIdentifierPreparer(compiler.IdentifierPreparer):
     # SparkSQL identifier specification:
     # ref: https://spark.apache.org/docs/latest/sql-ref-identifier.html
 
-    legal_characters = re.compile(r"^[A-Z0-9_]+$", re.I)
+    legal_characters = _LEGAL_CHARACTERS
 
     def __init__(self, dialect):
         super().__init__(dialect, initial_quote="`")
 
+    def _requires_quotes(self, value):
+        """Return True if the given identifier requires quoting."""
+        lc_value = value.lower()
+        return (
+            lc_value in self.reserved_words
+            or value[0] in self.illegal_initial_characters
+            or not _LEGAL_SET.issuperset(value)
+            or lc_value != value
+        )
+
+    def _requires_quotes_illegal_chars(self, value):
+        """Return True if the given identifier requires quoting, but not taking case convention into account."""
+        return not _LEGAL_SET.issuperset(value)
+
 
 class DatabricksDDLCompiler(compiler.DDLCompiler):
     def post_create_table(self, table):
-        return " USING DELTA"
+        return _USING_DELTA
 
     def visit_set_column_comment(self, create, **kw):
         """
@@ -27,17 +60,12 @@ class DatabricksDDLCompiler(compiler.DDLCompiler):
         "ALTER TABLE schema.table_name CHANGE COLUMN COLUMN_NAME COMMENT 'Comment to be added to column';"
 
         """
-        return """ALTER TABLE {0} CHANGE COLUMN {1} COMMENT {2}""".format(
-            self._format_table_from_column(
-                 create, use_schema=True
-            ),
-            self.preparer.format_column(
-                create.element, use_table=False
-            ),
-            self.sql_compiler.render_literal_value(
-                create.element.comment, sqltypes.String()
-            ),
-        )
+        if not create.element.comment:
+            return self.visit_drop_column_comment(create, **kw)
+
+        comment = self.sql_compiler.render_literal_value(create.element.comment, _STRING_TYPE)
+
+        return self._alter_change_column(create, " COMMENT ", comment)
 
     def visit_drop_column_comment(self, drop, **kw):
         """
@@ -46,59 +74,59 @@ class DatabricksDDLCompiler(compiler.DDLCompiler):
 
         Note: There is no syntactical 'DROP' statement in this case, the comment must be replaced with an empty string
         """
-        return "ALTER TABLE {0} CHANGE COLUMN {1} COMMENT '';".format(
-            self._format_table_from_column(
-                 drop, use_schema=True
-            ),
-            self.preparer.format_column(
-                drop.element, use_table=False
-            )
-        )
+        return self._alter_change_column(drop, _DROP_COMMENT_SUFFIX)
 
-    def _format_table_from_column(self, column_object, use_schema=False):
+    def _alter_change_column(self, element, *tail: str) -> str:
         """
-        Prepare a quoted table name from the column object (including schema if specified)
+        Prepare an "ALTER TABLE ... CHANGE COLUMN ..." statement for the column of a DDL element, followed by the
+        tail fragments. All fragments are joined in a single pass
         """
-        schema_table_column = self.preparer.format_column(
-                column_object.element, use_table=True, use_schema=True
-            )
-
-        name = schema_table_column.split(".")[1]
+        table = self._format_table_from_column(element, use_schema=True)
+        col = self.preparer.format_column(element.element, use_table=False)
 
-        if use_schema:
-            name = schema_table_column.split(".")[0] + '.' + name
+        return "".join(("ALTER TABLE ", table, " CHANGE COLUMN ", col) + tail)
 
-        return name
+    def _format_table_from_column(self, column_object: Any, use_schema: bool = False) -> str:
+        """
+        Prepare a quoted table name from the column object (including schema if specified)
+        """
+        return self.preparer.format_table(column_object.element.table, use_schema=use_schema)
 
-    def visit_create_table(self, create, **kw):
+    def visit_create_table(self, create: CreateTable, **kw: Any) -> str:
         table = create.element
         preparer = self.preparer
 
-        text = "\nCREATE "
-        if table._prefixes:
-            text += " ".join(table._prefixes) + " "
-
         # Default to 'IF NOT EXISTS'
-        text += "TABLE IF NOT EXISTS "
+        if table._prefixes:
+            parts = ["\nCREATE ", " ".join(table._prefixes), " TABLE IF NOT EXISTS "]
+        else:
+            parts = ["\nCREATE TABLE IF NOT EXISTS "]
 
-        text += preparer.format_table(table) + " "
+        parts.append(preparer.format_table(table))
+        parts.append(" ")
 
         create_table_suffix = self.create_table_suffix(table)
         if create_table_suffix:
-            text += create_table_suffix + " "
+            parts.append(create_table_suffix)
+            parts.append(" ")
 
-        text += "("
+        parts.append("(")
 
-        separator = "\n"
+        emitted = 0
 
         # if only one primary key, specify it along with the column
         first_pk = False
         liquid_clustering = False
-        liquid_cluster_columns = []
+        liquid_cluster_columns: List[str] = []
+
+        _process = self.process
+        _CompileError = exc.CompileError
+        _cluster_cols_append = liquid_cluster_columns.append
+
         for create_column in create.columns:
             column = create_column.element
             try:
-                processed = self.process(
+                processed = _process(
                     create_column, first_pk=column.primary_key and not first_pk
                 )
                 # Add backquotes to column names if there are none - assumes no spaces in column name
@@ -107,47 +135,46 @@ class DatabricksDDLCompiler(compiler.DDLCompiler):
                 if column.autoincrement is True:   # If doesn't work try 'is True' and == 'True'
                     processed = "`".join(processed.split("`")[:-1]) + "` " + "BIGINT GENERATED BY DEFAULT AS IDENTITY (START WITH 100000000 INCREMENT BY 1)"
                 if processed is not None:
-                    text += separator
-                    separator = ", \n"
-                    text += "\t" + processed
+                    parts.append(_SEPS[emitted])
+                    emitted = 1
+                    parts.append("\t")
+                    parts.append(processed)
                 if column.primary_key:
                     first_pk = True
-            except exc.CompileError as ce:
-                util.raise_(
-                    exc.CompileError(
-                        util.u(f"(in table '{table.description}', column '{column.name}'): {ce.args[0]}")
-                    ),
-                    from_=ce,
-                )
+            except _CompileError as ce:
+                raise _CompileError(
+                    f"(in table '{table.description}', column '{column.name}'): {ce.args[0]}"
+                ) from ce
 
             # Check for and apply liquid clustering
-            if 'databricks' in column.dialect_options:
-                try:
-                    cluster_on = column.dialect_options['databricks'].__getitem__('cluster_key')
-                    if cluster_on:
-                        liquid_clustering = True
-                        liquid_cluster_columns.append(column.name)
-                except KeyError:
-                    pass
+            dbx_opts = column.dialect_options.get('databricks')
+            if dbx_opts is not None:
+                cluster_on = dbx_opts.get('cluster_key')
+                if cluster_on:
+                    liquid_clustering = True
+                    _cluster_cols_append(column.name)
 
         const = self.create_table_constraints(
             table,
             _include_foreign_key_constraints=create.include_foreign_key_constraints,  # noqa
         )
         if const:
-            text += separator + "\t" + const
+            parts.append(_SEPS[emitted])
+            parts.append("\t")
+            parts.append(const)
 
-        text += f"\n){self.post_create_table(table)}\n"
+        parts.append("\n)")
+        parts.append(self.post_create_table(table))
+        parts.append("\n")
 
         if liquid_clustering:
-            text += f"{self.liquid_cluster_on_table(liquid_cluster_columns)}\n\n"
+            parts.append(self.liquid_cluster_on_table(liquid_cluster_columns))
+            parts.append("\n\n")
 
-        return text
+        return "".join(parts)
 
     def liquid_cluster_on_table(self, liquid_cluster_columns):
-        columns = liquid_cluster_columns
-
-        return """CLUSTER BY ({cols})""".format(cols=', '.join(columns))
+        return f"CLUSTER BY ({', '.join(liquid_cluster_columns)})"
 
     def visit_drop_table(self, drop, **kw):
         text = "\nDROP TABLE IF EXISTS "
@@ -161,18 +188,12 @@ class DatabricksDDLCompiler(compiler.DDLCompiler):
 @compiles(ColumnComment, "databricks")
 def visit_column_comment(
     element: ColumnComment, compiler: DatabricksDDLCompiler, **kw) -> str:
-    ddl = "ALTER TABLE `{schema}`.{table_name} ALTER COLUMN {column_name} COMMENT {comment}"
     comment = (
         compiler.sql_compiler.render_literal_value(
-            element.comment, sqltypes.String()
+            element.comment, _STRING_TYPE
         )
         if element.comment is not None
         else "NULL"
     )
 
-    return ddl.format(
-        schema=element.schema,
-        table_name=element.table_name,
-        column_name=element.column_name,
-        comment=comment,
-    )
+    return f"ALTER TABLE `{element.schema}`.{element.table_name} ALTER COLUMN {element.column_name} COMMENT {comment}"
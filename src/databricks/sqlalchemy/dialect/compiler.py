@@ -1,57 +1,72 @@
+from typing import Dict, Optional, Tuple
+
 from sqlalchemy.sql import compiler
 
+# Databricks type names, returned as the same str objects on every compilation
+_T_STRING = "STRING"
+_T_INT = "INT"
+_T_BIGINT = "BIGINT"
+_T_DECIMAL = "DECIMAL"
+_T_BINARY = "BINARY"
+_T_TIMESTAMP = "TIMESTAMP"
+_T_DATE = "DATE"
+_T_STRUCT = "STRUCT"
+
+# Rendered DECIMAL types keyed by (precision, scale); bounded by the distinct shapes in use
+_NUMERIC_CACHE: Dict[Tuple[Optional[int], Optional[int]], str] = {}
+
 
 class DatabricksTypeCompiler(compiler.GenericTypeCompiler):
     """Originally forked from pyhive"""
 
     def visit_INTEGER(self, type_):
-        return "INT"
+        return _T_INT
 
     def visit_BIGINT(self, type_):
-        return "BIGINT"
+        return _T_BIGINT
 
     def visit_NUMERIC(self, type_):
-        if type_.precision is None:
-            return "DECIMAL"
-        elif type_.scale is None:
-            return "DECIMAL({precision})".format(precision=type_.precision)
-        else:
-            return "DECIMAL({precision}, {scale})".format(precision=type_.precision, scale=type_.scale)
+        key = (type_.precision, type_.scale)
+        rendered = _NUMERIC_CACHE.get(key)
+        if rendered is None:
+            if type_.precision is None:
+                rendered = _T_DECIMAL
+            elif type_.scale is None:
+                rendered = f"DECIMAL({type_.precision})"
+            else:
+                rendered = f"DECIMAL({type_.precision}, {type_.scale})"
+            _NUMERIC_CACHE[key] = rendered
+        return rendered
 
     def visit_CHAR(self, type_):
-        return "STRING"
+        return _T_STRING
 
     def visit_VARCHAR(self, type_):
-        return "STRING"
+        return _T_STRING
 
     def visit_NCHAR(self, type_):
-        return "STRING"
+        return _T_STRING
 
     def visit_TEXT(self, type_):
-        return "STRING"
+        return _T_STRING
 
     def visit_CLOB(self, type_):
-        return "STRING"
+        return _T_STRING
 
     def visit_BLOB(self, type_):
-        return "BINARY"
+        return _T_BINARY
 
     def visit_TIME(self, type_):
-        return "TIMESTAMP"
+        return _T_TIMESTAMP
 
     def visit_DATE(self, type_):
-        return "DATE"
+        return _T_DATE
 
     def visit_DATETIME(self, type_):
-        return "TIMESTAMP"
+        return _T_TIMESTAMP
 
     def visit_JSON(self, type_):
-        return "STRUCT"
+        return _T_STRUCT
 
     def visit_ARRAY(self, type_):
-        element_type = type_.item_type
-        element_type = str(element_type)
-        if element_type == 'VARCHAR':
-            return "ARRAY<STRING>"
-        else:
-            return "ARRAY<{type}>".format(type=type_.item_type)
+        return "ARRAY<%s>" % self.process(type_.item_type)
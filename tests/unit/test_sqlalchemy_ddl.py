@@ -0,0 +1,129 @@
+import unittest
+
+from sqlalchemy import Column, Integer, MetaData, Numeric, String, Table, exc, text
+from sqlalchemy.types import NullType
+from sqlalchemy.schema import CreateTable, SetColumnComment
+
+from databricks.sqlalchemy import DatabricksDialect
+
+
+class DatabricksDDLCompilerTests(unittest.TestCase):
+    def setUp(self):
+        self.dialect = DatabricksDialect()
+        self.metadata = MetaData()
+
+    def compile(self, element):
+        return str(element.compile(dialect=self.dialect))
+
+    def test_create_table_respects_schema_translate_map(self):
+        translate = {"schema_translate_map": {"s": "p"}, "render_schema_translate": True}
+        first = Table("t", self.metadata, Column("id", Integer), schema="s")
+        second = Table("t2", self.metadata, Column("id", Integer), schema="s")
+
+        plain_then_translated = [
+            self.compile(CreateTable(first)),
+            str(CreateTable(first).compile(dialect=self.dialect, **translate)),
+        ]
+        translated_then_plain = [
+            str(CreateTable(second).compile(dialect=self.dialect, **translate)),
+            self.compile(CreateTable(second)),
+        ]
+
+        self.assertIn("TABLE IF NOT EXISTS s.t ", plain_then_translated[0])
+        self.assertIn("TABLE IF NOT EXISTS p.t ", plain_then_translated[1])
+        self.assertIn("TABLE IF NOT EXISTS p.t2 ", translated_then_plain[0])
+        self.assertIn("TABLE IF NOT EXISTS s.t2 ", translated_then_plain[1])
+
+    def test_create_table_reflects_new_column(self):
+        table = Table("t", self.metadata, Column("id", Integer, primary_key=True), schema="s")
+        before = self.compile(CreateTable(table))
+
+        table.append_column(Column("name", String(10)))
+        after = self.compile(CreateTable(table))
+
+        self.assertNotIn("`name`", before)
+        self.assertIn("`name` STRING", after)
+
+    def test_create_table_reflects_replaced_column_type(self):
+        table = Table("t", self.metadata, Column("a", Integer))
+
+        for i in range(50):
+            if i % 2:
+                table.c.a.type = String(5)
+                expected = "`a` STRING"
+            else:
+                table.c.a.type = Integer()
+                expected = "`a` INT"
+            self.assertIn(expected, self.compile(CreateTable(table)))
+
+    def test_create_table_reflects_type_mutated_in_place(self):
+        table = Table("t", self.metadata, Column("a", Numeric(10, 2)))
+        self.assertIn("`a` DECIMAL(10, 2)", self.compile(CreateTable(table)))
+
+        table.c.a.type.precision = 20
+        self.assertIn("`a` DECIMAL(20, 2)", self.compile(CreateTable(table)))
+
+    def test_create_table_reflects_changed_server_default(self):
+        table = Table("t", self.metadata, Column("a", Integer, server_default=text("1")))
+        self.assertIn("DEFAULT 1", self.compile(CreateTable(table)))
+
+        table.c.a.server_default.arg = text("2")
+        self.assertIn("DEFAULT 2", self.compile(CreateTable(table)))
+
+    def test_create_table_column_error_names_table_and_column(self):
+        table = Table("t", self.metadata, Column("bad", NullType()))
+
+        with self.assertRaises(exc.CompileError) as cm:
+            self.compile(CreateTable(table))
+
+        self.assertIn("(in table 't', column 'bad')", str(cm.exception))
+        self.assertIsInstance(cm.exception.__cause__, exc.CompileError)
+
+    def test_set_column_comment_with_schema(self):
+        table = Table("t", self.metadata, Column("c", Integer, comment="hi"), schema="s")
+
+        self.assertEqual(
+            self.compile(SetColumnComment(table.c.c)), "ALTER TABLE s.t CHANGE COLUMN c COMMENT 'hi'"
+        )
+
+    def test_set_column_comment_without_schema(self):
+        table = Table("t", self.metadata, Column("c", Integer, comment="hi"))
+
+        self.assertEqual(
+            self.compile(SetColumnComment(table.c.c)), "ALTER TABLE t CHANGE COLUMN c COMMENT 'hi'"
+        )
+
+    def test_set_empty_column_comment_clears_comment(self):
+        table = Table("t", self.metadata, Column("a", Integer), Column("b", Integer, comment=""), schema="s")
+
+        self.assertEqual(
+            self.compile(SetColumnComment(table.c.a)), "ALTER TABLE s.t CHANGE COLUMN a COMMENT '';"
+        )
+        self.assertEqual(
+            self.compile(SetColumnComment(table.c.b)), "ALTER TABLE s.t CHANGE COLUMN b COMMENT '';"
+        )
+
+    def test_set_column_comment_on_table_name_containing_dot(self):
+        table = Table("my.table", self.metadata, Column("c", Integer, comment="hi"), schema="s")
+
+        self.assertEqual(
+            self.compile(SetColumnComment(table.c.c)),
+            "ALTER TABLE s.`my.table` CHANGE COLUMN c COMMENT 'hi'",
+        )
+
+
+class DatabricksIdentifierPreparerTests(unittest.TestCase):
+    def setUp(self):
+        self.preparer = DatabricksDialect().identifier_preparer
+
+    def test_legal_identifier_is_not_quoted(self):
+        self.assertEqual(self.preparer.quote("col_1"), "col_1")
+
+    def test_identifiers_requiring_quotes(self):
+        self.assertEqual(self.preparer.quote("my col"), "`my col`")
+        self.assertEqual(self.preparer.quote("MixedCase"), "`MixedCase`")
+        self.assertEqual(self.preparer.quote("select"), "`select`")
+
+    def test_non_ascii_identifier_is_quoted(self):
+        # U+017F case-folds to "s", so a case-insensitive [A-Z] regex would accept it
+        self.assertEqual(self.preparer.quote("ca\u017fe"), "`ca\u017fe`")
@@ -0,0 +1,67 @@
+import unittest
+
+import sqlalchemy
+from sqlalchemy import Column, Integer, MetaData, Table, insert, select
+from sqlalchemy import types
+
+from databricks.sqlalchemy import DatabricksDialect
+
+
+@unittest.skipIf(sqlalchemy.__version__ < "1.4", "Compiled statement caching was added in SQLAlchemy 1.4")
+class DatabricksStatementCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.dialect = DatabricksDialect()
+        self.table = Table("t", MetaData(), Column("id", Integer), Column("value", Integer))
+
+    def assert_second_compile_hits_cache(self, make_statement):
+        compiled_cache = {}
+        cache_results = []
+        for i in range(2):
+            _, _, cache_hit = make_statement(i)._compile_w_cache(
+                self.dialect, compiled_cache=compiled_cache, column_keys=[]
+            )
+            cache_results.append(cache_hit)
+
+        self.assertEqual(cache_results, [self.dialect.CACHE_MISS, self.dialect.CACHE_HIT])
+
+    def test_dialect_supports_statement_cache(self):
+        self.assertTrue(DatabricksDialect.supports_statement_cache)
+
+    def test_select_is_served_from_compiled_cache(self):
+        self.assert_second_compile_hits_cache(
+            lambda i: select(self.table.c.value).where(self.table.c.id == i)
+        )
+
+    def test_insert_is_served_from_compiled_cache(self):
+        self.assert_second_compile_hits_cache(
+            lambda i: insert(self.table).values(id=i, value=i)
+        )
+
+
+class DatabricksTypeCompilerTests(unittest.TestCase):
+    def setUp(self):
+        self.type_compiler = DatabricksDialect().type_compiler
+
+    def test_fixed_name_types(self):
+        self.assertEqual(self.type_compiler.process(types.VARCHAR(10)), "STRING")
+        self.assertEqual(self.type_compiler.process(types.DATETIME()), "TIMESTAMP")
+        self.assertEqual(self.type_compiler.process(types.INTEGER()), "INT")
+
+    def test_generic_types_fall_back_to_visit_methods(self):
+        self.assertEqual(self.type_compiler.process(types.String(10)), "STRING")
+        self.assertEqual(self.type_compiler.process(types.Integer()), "INT")
+        self.assertEqual(self.type_compiler.process(types.LargeBinary()), "BINARY")
+
+    def test_numeric_precision_and_scale(self):
+        for _ in range(2):
+            self.assertEqual(self.type_compiler.process(types.NUMERIC()), "DECIMAL")
+            self.assertEqual(self.type_compiler.process(types.NUMERIC(18)), "DECIMAL(18)")
+            self.assertEqual(self.type_compiler.process(types.NUMERIC(18, 2)), "DECIMAL(18, 2)")
+
+    def test_array_compiles_item_type_with_dialect(self):
+        self.assertEqual(self.type_compiler.process(types.ARRAY(types.VARCHAR())), "ARRAY<STRING>")
+        self.assertEqual(self.type_compiler.process(types.ARRAY(types.VARCHAR(10))), "ARRAY<STRING>")
+        self.assertEqual(self.type_compiler.process(types.ARRAY(types.INTEGER())), "ARRAY<INT>")
+        self.assertEqual(
+            self.type_compiler.process(types.ARRAY(types.NUMERIC(10, 2))), "ARRAY<DECIMAL(10, 2)>"
+        )